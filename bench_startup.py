@@ -0,0 +1,87 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+ENTRY_POINTS = ["bsdd_to_ids", "ids_to_bsdd"]
+
+
+def time_import(module, repeat):
+    """Measures how long a fresh interpreter takes to import a module.
+
+    Args:
+        module (str): The module name of the entry point.
+        repeat (int): Number of measurements.
+
+    Returns:
+        list: Import times in seconds.
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=SCRIPT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        timings.append(float(result.stdout.strip()))
+    return timings
+
+
+def time_first_output(module, repeat):
+    """Measures the time from process start until the first byte of --help output.
+
+    Args:
+        module (str): The module name of the entry point.
+        repeat (int): Number of measurements.
+
+    Returns:
+        list: First-output latencies in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, f"{module}.py", "--help"],
+            cwd=SCRIPT_DIR,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        process.stdout.read(1)
+        timings.append(time.perf_counter() - start)
+        process.stdout.read()
+        process.wait()
+    return timings
+
+
+def format_timings(timings):
+    return f"median {statistics.median(timings) * 1000:8.1f} ms, min {min(timings) * 1000:8.1f} ms"
+
+
+def main(repeat):
+    for module in ENTRY_POINTS:
+        print(f"{module}")
+        print(f"  import:       {format_timings(time_import(module, repeat))}")
+        print(f"  first output: {format_timings(time_first_output(module, repeat))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark import time and first-output latency of the command line scripts",
+        epilog="Example command: python bench_startup.py -n 10",
+    )
+    parser.add_argument(
+        "-n", "--repeat", type=int, default=5, help="Number of runs (default: 5)"
+    )
+    args = parser.parse_args()
+
+    main(args.repeat)
@@ -2,18 +2,26 @@ import argparse
 import hashlib
 import json
 import os
-import requests
+import threading
+import time
 from collections import defaultdict
-from tqdm import tqdm
-from ifctester import ids, reporter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# requests, tqdm and ifctester are imported where they are used, so --help and
+# fully cached runs only load the dependencies they need.
 
 APP_VERSION = "1.0"
 
 BASE_URL = "https://api.bsdd.buildingsmart.org"
 FETCH_LIMIT = 1000
+MAX_WORKERS = 8
 CACHE_DIR = "cache"
+REGISTRY_FILENAME = "dictionary_registry.json"
+REGISTRY_MAX_AGE = 24 * 60 * 60  # seconds
 
 IFC_VERSIONS = "IFC4X3_ADD2"  # 'IFC4 IFC4X3_ADD2'
+IFC_DICTIONARY_URI = "https://identifier.buildingsmart.org/uri/buildingsmart/ifc/4.3"
+DATATYPE_INDEX_FILENAME = "property_datatype_index.json"
 
 INCLUDEDRELATIONTYPES = [
     "HasMaterial",
@@ -35,6 +43,34 @@ DATATYPE_MAPPING = {
     "Time": "IfcDateTime",
 }
 
+# bSDD dimensions are the exponents of length, mass, time, electric current,
+# thermodynamic temperature, amount of substance and luminous intensity.
+# Only dimensions with exactly one IFC measure type are listed. Length (e.g.
+# IfcPositiveLengthMeasure), time, frequency, pressure, energy, power and
+# dimensionless quantities (ratios, angles) have several candidates and are
+# left out, as ifctester compares data types exactly.
+DIMENSION_MEASURE_MAPPING = {
+    "2 0 0 0 0 0 0": "IfcAreaMeasure",
+    "3 0 0 0 0 0 0": "IfcVolumeMeasure",
+    "0 1 0 0 0 0 0": "IfcMassMeasure",
+    "0 0 0 1 0 0 0": "IfcElectricCurrentMeasure",
+    "0 0 0 0 1 0 0": "IfcThermodynamicTemperatureMeasure",
+    "0 0 0 0 0 1 0": "IfcAmountOfSubstanceMeasure",
+    "0 0 0 0 0 0 1": "IfcLuminousIntensityMeasure",
+    "1 0 -1 0 0 0 0": "IfcLinearVelocityMeasure",
+    "3 0 -1 0 0 0 0": "IfcVolumetricFlowRateMeasure",
+    "0 1 -1 0 0 0 0": "IfcMassFlowRateMeasure",
+    "-3 1 0 0 0 0 0": "IfcMassDensityMeasure",
+    "-1 1 0 0 0 0 0": "IfcMassPerLengthMeasure",
+    "1 1 -2 0 0 0 0": "IfcForceMeasure",
+    "2 1 -3 -1 0 0 0": "IfcElectricVoltageMeasure",
+    "0 1 -3 0 -1 0 0": "IfcThermalTransmittanceMeasure",
+    "1 1 -3 0 -1 0 0": "IfcThermalConductivityMeasure",
+    "0 -1 3 0 1 0 0": "IfcThermalResistanceMeasure",
+    "2 0 -2 0 -1 0 0": "IfcSpecificHeatCapacityMeasure",
+}
+
+# Curated overrides, these take precedence over the datatype index.
 PROPERTY_DATATYPE_MAPPING = {
     "https://identifier.buildingsmart.org/uri/buildingsmart/ifc/4.3/prop/AcousticRating": "IfcLabel",
     "https://identifier.buildingsmart.org/uri/buildingsmart/ifc/4.3/prop/CapacityPeople": "IfcCountMeasure",
@@ -117,6 +153,27 @@ REQUEST_HEADERS = {"User-Agent": f"bSDD_dictionary_to_IDS/{APP_VERSION}"}
 
 dictionary_map = {}
 classification_map = {}
+dictionary_registry = {}
+registry_loaded = False
+property_datatype_index = {}
+relation_graph = {}
+session = None
+session_lock = threading.Lock()
+ids = None  # ifctester.ids, imported by load_ids()
+
+
+def load_ids():
+    """Imports ifctester.ids on first use.
+
+    The facet builders use the module-level ids, so the functions that create
+    specifications call this once before building them.
+    """
+    global ids
+    if ids is None:
+        from ifctester import ids as ifctester_ids
+
+        ids = ifctester_ids
+    return ids
 
 
 def url_to_filename(url):
@@ -135,9 +192,37 @@ def url_to_filename(url):
 def get_data_type(dataType, propertyUri):
     if propertyUri in PROPERTY_DATATYPE_MAPPING:
         return PROPERTY_DATATYPE_MAPPING[propertyUri]
+    if propertyUri in property_datatype_index:
+        return property_datatype_index[propertyUri]
     return DATATYPE_MAPPING.get(dataType, "IFCLABEL")
 
 
+def get_property_measure_type(bsdd_property):
+    if bsdd_property.get("dataType") not in ["Real", "Integer"]:
+        return None
+    dimension = " ".join((bsdd_property.get("dimension") or "").split())
+    return DIMENSION_MEASURE_MAPPING.get(dimension)
+
+
+def get_session():
+    """Returns the shared HTTP session, sized for MAX_WORKERS concurrent requests."""
+    global session
+    with session_lock:
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.headers.update(REQUEST_HEADERS)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS)
+            session.mount("https://", adapter)
+    return session
+
+
+def http_get(endpoint, params):
+    return get_session().get(endpoint, params=params)
+
+
 def split_ifc_bsdd_code(item):
     # Check if the last character is uppercase; if not, return the item without splitting.
     if not item[-1].isupper() or not item[-1].isalpha():
@@ -183,7 +268,7 @@ def fetch_all_paginated(endpoint, params={}):
 
     while True:
         params["offset"] = offset
-        response = requests.get(endpoint, params=params, headers=REQUEST_HEADERS)
+        response = http_get(endpoint, params)
         if response.status_code != 200:
             print(f"Failed to fetch data: {response.status_code}")
             break
@@ -197,6 +282,240 @@ def fetch_all_paginated(endpoint, params={}):
     return responses
 
 
+def fetch_dictionary_list(base_url):
+    """Fetches all dictionaries from the bSDD dictionary list endpoint.
+
+    Args:
+        base_url (str): The bSDD API base URL.
+
+    Returns:
+        list: The dictionaries, or None if a page failed to load.
+    """
+    endpoint = f"{base_url}/api/Dictionary/v1"
+    params = {"IncludeTestDictionaries": True}
+    dictionaries = []
+    offset = 0
+    limit = FETCH_LIMIT
+    params["limit"] = limit
+
+    while True:
+        params["offset"] = offset
+        response = http_get(endpoint, params)
+        if response.status_code != 200:
+            print(f"Failed to fetch dictionaries: {response.status_code}")
+            return None
+        data = response.json()
+        batch = data.get("dictionaries", [])
+        dictionaries.extend(batch)
+        total_count = data.get("totalCount", 0)
+        if len(batch) == 0 or (offset + len(batch)) >= total_count:
+            break
+        offset += limit
+
+    return dictionaries
+
+
+def build_dictionary_registry(dictionaries):
+    """Indexes a dictionary list by URI.
+
+    Args:
+        dictionaries (list): Dictionaries as returned by the bSDD API.
+
+    Returns:
+        dict: Mapping of dictionary URI to name, version, status and last update.
+    """
+    registry = {}
+    for dictionary in dictionaries:
+        uri = dictionary.get("uri")
+        if not uri:
+            continue
+        registry[uri] = {
+            "name": dictionary.get("name"),
+            "version": dictionary.get("version"),
+            "status": dictionary.get("status"),
+            "lastUpdatedUtc": dictionary.get("lastUpdatedUtc"),
+        }
+    return registry
+
+
+def load_dictionary_registry(base_url, use_cache, max_age=REGISTRY_MAX_AGE):
+    """Loads the dictionary registry index, refreshing it when it is too old.
+
+    The registry is loaded at most once per run, also when fetching fails, and
+    is kept in memory for the rest of the run. When the cache is enabled it is
+    stored on disk together with the time it was fetched; if a refresh fails,
+    the stale registry on disk is used instead.
+
+    Args:
+        base_url (str): The bSDD API base URL.
+        use_cache (bool): Read and write the registry in the local cache.
+        max_age (int): Maximum age of the cached registry in seconds.
+
+    Returns:
+        dict: Mapping of dictionary URI to name, version, status and last update.
+    """
+    global registry_loaded
+    if registry_loaded:
+        return dictionary_registry
+    registry_loaded = True
+
+    cached = None
+    temp_filename = os.path.join(CACHE_DIR, REGISTRY_FILENAME)
+    if use_cache and os.path.isfile(temp_filename):
+        with open(temp_filename, "r") as f:
+            cached = json.load(f)
+        if time.time() - cached.get("fetched", 0) <= max_age:
+            dictionary_registry.update(cached.get("dictionaries", {}))
+            return dictionary_registry
+
+    dictionaries = fetch_dictionary_list(base_url)
+    if dictionaries is None:
+        if cached:
+            print("Using outdated dictionary registry from cache")
+            dictionary_registry.update(cached.get("dictionaries", {}))
+        return dictionary_registry
+
+    dictionary_registry.update(build_dictionary_registry(dictionaries))
+
+    if use_cache:
+        with open(temp_filename, "w") as f:
+            json.dump({"fetched": time.time(), "dictionaries": dictionary_registry}, f)
+
+    return dictionary_registry
+
+
+def fetch_dictionary_properties(base_url, dictionary_uri):
+    endpoint = f"{base_url}/api/Dictionary/v1/Properties"
+    params = {"Uri": dictionary_uri}
+    properties = []
+    offset = 0
+    limit = FETCH_LIMIT
+    params["limit"] = limit
+
+    while True:
+        params["offset"] = offset
+        response = http_get(endpoint, params)
+        if response.status_code != 200:
+            print(f"Failed to fetch properties: {response.status_code}")
+            return None
+        data = response.json()
+        batch = data.get("properties", [])
+        properties.extend(batch)
+        total_count = data.get("totalCount", 0)
+        if len(batch) == 0 or (offset + len(batch)) >= total_count:
+            break
+        offset += limit
+
+    return properties
+
+
+def build_property_datatype_index(properties):
+    """Maps property URIs to IFC measure types derived from their dimension.
+
+    This is a heuristic: only properties whose dimension maps to a single IFC
+    measure type are indexed. Other properties fall back to DATATYPE_MAPPING.
+
+    Args:
+        properties (list): Properties as returned by the bSDD API.
+
+    Returns:
+        dict: Mapping of property URI to derived IFC measure type.
+    """
+    index = {}
+    for bsdd_property in properties:
+        uri = bsdd_property.get("uri")
+        measure_type = get_property_measure_type(bsdd_property)
+        if uri and measure_type:
+            index[uri] = measure_type
+    return index
+
+
+def load_property_datatype_index(
+    base_url, use_cache, ifc_dictionary_uri=IFC_DICTIONARY_URI
+):
+    """Loads the property datatype index of the IFC dictionary.
+
+    The index is built once from the property list of the IFC dictionary and,
+    when the cache is enabled, stored on disk with the IFC dictionary it came
+    from. A cached index of another IFC version is rebuilt.
+
+    Args:
+        base_url (str): The bSDD API base URL.
+        use_cache (bool): Read and write the index in the local cache.
+        ifc_dictionary_uri (str): The URI of the IFC dictionary.
+
+    Returns:
+        dict: Mapping of property URI to derived IFC measure type.
+    """
+    if property_datatype_index:
+        return property_datatype_index
+
+    temp_filename = os.path.join(CACHE_DIR, DATATYPE_INDEX_FILENAME)
+    if use_cache and os.path.isfile(temp_filename):
+        with open(temp_filename, "r") as f:
+            cached = json.load(f)
+        if cached.get("ifcDictionaryUri") == ifc_dictionary_uri:
+            property_datatype_index.update(cached.get("properties", {}))
+            return property_datatype_index
+
+    properties = fetch_dictionary_properties(base_url, ifc_dictionary_uri)
+    if properties is None:
+        return property_datatype_index
+
+    property_datatype_index.update(build_property_datatype_index(properties))
+
+    if use_cache:
+        with open(temp_filename, "w") as f:
+            json.dump(
+                {
+                    "ifcDictionaryUri": ifc_dictionary_uri,
+                    "properties": property_datatype_index,
+                },
+                f,
+            )
+
+    return property_datatype_index
+
+
+def uses_ifc_properties(class_uris, inherit_properties=False):
+    """Checks whether the property facets of the classes will use IFC properties.
+
+    Related classes are not checked, except for the ancestors whose properties
+    are inherited.
+
+    Args:
+        class_uris (list): The URIs of the dictionary classes.
+        inherit_properties (bool): Also check the inherited properties.
+
+    Returns:
+        bool: True if a property URI points into IFC_DICTIONARY_URI.
+    """
+    for class_uri in class_uris:
+        node_uris = [class_uri]
+        if inherit_properties:
+            node_uris += get_ancestors(class_uri)
+        for node_uri in node_uris:
+            node = relation_graph.get(node_uri)
+            if not node:
+                continue
+            for bsdd_property in node["classProperties"]:
+                property_uri = bsdd_property.get("propertyUri") or ""
+                if property_uri.startswith(IFC_DICTIONARY_URI):
+                    return True
+    return False
+
+
+def get_dictionary_name(base_url, dictionary_uri, use_cache):
+    registry = load_dictionary_registry(base_url, use_cache)
+    if dictionary_uri in registry:
+        return registry[dictionary_uri].get("name")
+
+    dictionary = fetch_dictionary(base_url, dictionary_uri, use_cache)
+    if dictionary:
+        return dictionary.get("name")
+    return None
+
+
 def fetch_dictionary(base_url, dictionary_uri, use_cache):
     if dictionary_uri in dictionary_map:
         return dictionary_map[dictionary_uri]
@@ -206,11 +525,12 @@ def fetch_dictionary(base_url, dictionary_uri, use_cache):
         temp_filename = os.path.join(CACHE_DIR, f"dictionary_{filename_safe_uri}.json")
         if os.path.isfile(temp_filename):
             with open(temp_filename, "r") as f:
-                return json.load(f)
+                dictionary_map[dictionary_uri] = json.load(f)
+                return dictionary_map[dictionary_uri]
 
     endpoint = f"{base_url}/api/Dictionary/v1"
     params = {"Uri": dictionary_uri, "IncludeTestDictionaries": True}
-    response = requests.get(endpoint, params=params, headers=REQUEST_HEADERS)
+    response = http_get(endpoint, params)
     if response.status_code != 200:
         print(f"Failed to fetch dictionary: {response.status_code}")
         return None
@@ -222,6 +542,7 @@ def fetch_dictionary(base_url, dictionary_uri, use_cache):
             json.dump(dictionaries[0], f)
 
     if dictionaries:
+        dictionary_map[dictionary_uri] = dictionaries[0]
         return dictionaries[0]
     else:
         return None
@@ -251,7 +572,7 @@ def fetch_classes(base_url, dictionary_uri, use_cache):
 
     while True:
         params["offset"] = offset
-        response = requests.get(endpoint, params=params, headers=REQUEST_HEADERS)
+        response = http_get(endpoint, params)
         if response.status_code != 200:
             print(f"Failed to fetch data: {response.status_code}")
             break
@@ -279,35 +600,78 @@ def fetch_classes(base_url, dictionary_uri, use_cache):
     return dictionary_classes
 
 
-def fetch_class_details(base_url, class_uri, use_cache):
-    if class_uri in classification_map:
-        return classification_map[class_uri]
+def fetch_class_details(
+    base_url, class_uri, use_cache, language_code=None, include_details=True
+):
+    cache_key = class_uri
+    if language_code:
+        cache_key = f"{cache_key}|{language_code}"
+    if not include_details:
+        cache_key = f"{cache_key}|basic"
+
+    if cache_key in classification_map:
+        return classification_map[cache_key]
 
     if use_cache:
-        filename_safe_uri = url_to_filename(class_uri)
+        filename_safe_uri = url_to_filename(cache_key)
         temp_filename = os.path.join("cache", f"class_{filename_safe_uri}.json")
         if os.path.isfile(temp_filename):
             with open(temp_filename, "r") as f:
-                return json.load(f)
+                classification_map[cache_key] = json.load(f)
+                return classification_map[cache_key]
 
     endpoint = f"{base_url}/api/Class/v1"
     params = {
         "Uri": class_uri,
-        "IncludeClassProperties": True,
-        "IncludeClassRelations": True,
+        "IncludeClassProperties": include_details,
+        "IncludeClassRelations": include_details,
     }
-    response = requests.get(endpoint, params=params, headers=REQUEST_HEADERS)
+    if language_code:
+        params["languageCode"] = language_code
+    response = http_get(endpoint, params)
     if response.status_code != 200:
         print(f"Failed to fetch class: {class_uri}, {response.status_code}")
         return None
     class_details = response.json()
-    classification_map[class_uri] = class_details
+    classification_map[cache_key] = class_details
     if use_cache and class_details:
         with open(temp_filename, "w") as f:
             json.dump(class_details, f)
     return class_details
 
 
+def prefetch_class_details(class_uris, languages, use_cache):
+    """Fetches all class variants concurrently on the shared session.
+
+    The first language gets the full class details (properties and relations),
+    which are shared by all languages. The other languages only fetch the
+    localized name and definition.
+
+    Args:
+        class_uris (list): The URIs of the classes to fetch.
+        languages (list): Language codes, or [None] for the default language.
+        use_cache (bool): Use local cache.
+    """
+    from tqdm import tqdm
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = []
+        for class_uri in class_uris:
+            for index, language_code in enumerate(languages):
+                futures.append(
+                    executor.submit(
+                        fetch_class_details,
+                        BASE_URL,
+                        class_uri,
+                        use_cache,
+                        language_code,
+                        index == 0,
+                    )
+                )
+        for future in tqdm(as_completed(futures), total=len(futures)):
+            future.result()
+
+
 def create_classification_facet_with_options(
     parent_element, base_uri, values, full_uris
 ):
@@ -325,17 +689,181 @@ def create_classification_facet_with_options(
     parent_element.append(classification)
 
 
+def get_relation_type(relation):
+    # The API returns camelCase keys; RelationType is still accepted
+    return relation.get("relationType", relation.get("RelationType"))
+
+
+def get_graph_node(class_details):
+    return {
+        "code": class_details.get("code", ""),
+        "name": class_details.get("name", ""),
+        "dictionaryUri": class_details.get("dictionaryUri", ""),
+        "relations": [
+            {
+                "relationType": get_relation_type(relation),
+                "relatedClassUri": relation.get("relatedClassUri"),
+            }
+            for relation in class_details.get("classRelations", [])
+            if get_relation_type(relation) in INCLUDEDRELATIONTYPES
+            and relation.get("relatedClassUri")
+        ],
+        "classProperties": class_details.get("classProperties", []),
+    }
+
+
+def build_relation_graph(
+    class_uris, use_cache, language_code=None, follow_ancestors=False
+):
+    """Builds the adjacency index of the given classes and their related classes.
+
+    Classes are fetched level by level, each level concurrently. The related
+    classes of the given classes are always added as nodes. With
+    follow_ancestors, IsChildOf relations are followed further from the classes
+    reached through IsChildOf, so all ancestors are in the graph. Visited
+    classes are skipped, which makes the traversal safe against cycles.
+
+    Args:
+        class_uris (list): The URIs of the dictionary classes.
+        use_cache (bool): Use local cache.
+        language_code (str): Language of the dictionary classes, as prefetched.
+        follow_ancestors (bool): Follow IsChildOf past the first hop.
+
+    Returns:
+        dict: Mapping of class URI to its graph node.
+    """
+    visited = set(class_uris)
+    frontier = list(class_uris)
+    root_uris = set(class_uris)
+    child_of_uris = set()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        while frontier:
+            results = executor.map(
+                lambda class_uri: fetch_class_details(
+                    BASE_URL,
+                    class_uri,
+                    use_cache,
+                    language_code if class_uri in root_uris else None,
+                ),
+                frontier,
+            )
+            next_frontier = []
+            for class_uri, class_details in zip(frontier, results):
+                if not class_details:
+                    continue
+                node = get_graph_node(class_details)
+                relation_graph[class_uri] = node
+                is_root = class_uri in root_uris
+                if not is_root and not (
+                    follow_ancestors and class_uri in child_of_uris
+                ):
+                    continue
+                for relation in node["relations"]:
+                    related_uri = relation["relatedClassUri"]
+                    is_child_of = relation["relationType"] == "IsChildOf"
+                    if related_uri in visited or not (is_root or is_child_of):
+                        continue
+                    visited.add(related_uri)
+                    next_frontier.append(related_uri)
+                    if is_child_of:
+                        child_of_uris.add(related_uri)
+            frontier = next_frontier
+
+    return relation_graph
+
+
+def get_related_class(class_uri, use_cache):
+    if class_uri not in relation_graph:
+        class_details = fetch_class_details(BASE_URL, class_uri, use_cache)
+        if not class_details:
+            return None
+        relation_graph[class_uri] = get_graph_node(class_details)
+    return relation_graph[class_uri]
+
+
+def get_ancestors(class_uri):
+    """Returns the IsChildOf ancestors of a class in the same dictionary.
+
+    Parents in other dictionaries, such as IFC, are skipped and not traversed
+    further, because their properties are not requirements of this dictionary.
+
+    Args:
+        class_uri (str): The URI of the class in the relation graph.
+
+    Returns:
+        list: Ancestor URIs, nearest ancestor first.
+    """
+    node = relation_graph.get(class_uri)
+    if not node:
+        return []
+    dictionary_uri = node["dictionaryUri"]
+    ancestors = []
+    visited = {class_uri}
+    frontier = [class_uri]
+    while frontier:
+        next_frontier = []
+        for uri in frontier:
+            node = relation_graph.get(uri)
+            if not node:
+                continue
+            for relation in node["relations"]:
+                parent_uri = relation["relatedClassUri"]
+                if relation["relationType"] != "IsChildOf" or parent_uri in visited:
+                    continue
+                visited.add(parent_uri)
+                # Parents that couldn't be fetched have no node
+                if parent_uri not in relation_graph:
+                    continue
+                if relation_graph[parent_uri]["dictionaryUri"] != dictionary_uri:
+                    continue
+                ancestors.append(parent_uri)
+                next_frontier.append(parent_uri)
+        frontier = next_frontier
+    return ancestors
+
+
+def get_inherited_properties(class_uri, class_properties):
+    """Returns the properties of the ancestors that the class doesn't define itself.
+
+    Args:
+        class_uri (str): The URI of the class in the relation graph.
+        class_properties (list): The class's own properties.
+
+    Returns:
+        list: Inherited properties, nearest ancestor first.
+    """
+    defined = {
+        (bsdd_property.get("propertySet"), bsdd_property.get("propertyCode"))
+        for bsdd_property in class_properties
+    }
+    inherited_properties = []
+    for ancestor_uri in get_ancestors(class_uri):
+        for bsdd_property in relation_graph[ancestor_uri]["classProperties"]:
+            key = (bsdd_property.get("propertySet"), bsdd_property.get("propertyCode"))
+            if key in defined:
+                continue
+            defined.add(key)
+            inherited_properties.append(bsdd_property)
+    return inherited_properties
+
+
+def export_relation_graph(filepath):
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(relation_graph, f, ensure_ascii=False, indent=2)
+
+
 def group_class_relations_by_dictionary(class_relations, use_cache):
     grouped_relations = defaultdict(list)
     full_uris_by_base = defaultdict(set)
     for relation in class_relations:
-        if relation.get("RelationType") not in INCLUDEDRELATIONTYPES:
+        if get_relation_type(relation) not in INCLUDEDRELATIONTYPES:
             continue
         class_uri = relation.get("relatedClassUri")
         if not class_uri:
             continue
 
-        classification = fetch_class_details(BASE_URL, class_uri, use_cache)
+        classification = get_related_class(class_uri, use_cache)
         if not classification:
             continue
 
@@ -366,14 +894,12 @@ def add_classification_facets(
         ):
             continue
 
-        dictionary = fetch_dictionary(BASE_URL, dictionary_uri, use_cache)
-        if dictionary:
-            system_name = dictionary.get("name")
-            if system_name:
-                full_uris = list(full_uris_by_base[dictionary_uri])
-                create_classification_facet_with_options(
-                    parent_element, system_name, class_codes, full_uris
-                )
+        system_name = get_dictionary_name(BASE_URL, dictionary_uri, use_cache)
+        if system_name:
+            full_uris = list(full_uris_by_base[dictionary_uri])
+            create_classification_facet_with_options(
+                parent_element, system_name, class_codes, full_uris
+            )
 
 
 def add_classification_references(class_relations, parent_element, use_cache):
@@ -452,6 +978,8 @@ def add_properties(class_properties, parent_element):
 def add_global_dictionary_applicability(
     dictionary_name, dictionary_uri, ids_document, ifc_entities
 ):
+    load_ids()
+
     specification = ids.Specification(
         name=f"Presence of {dictionary_name}",
         ifcVersion=IFC_VERSIONS,
@@ -472,35 +1000,154 @@ def add_global_dictionary_applicability(
     ids_document.specifications.append(specification)
 
 
-def add_class_specification(dictionary_name, dictionary_class, ids_document, use_cache):
-    class_details = fetch_class_details(BASE_URL, dictionary_class["uri"], use_cache)
+def get_class_requirements(
+    class_uri, class_details, use_cache, inherit_properties=False
+):
+    requirements = []
+
+    add_entity_facet(class_details.get("relatedIfcEntityNames", []), requirements)
+
+    add_classification_references(
+        class_details.get("classRelations", []), requirements, use_cache
+    )
+
+    class_properties = class_details.get("classProperties", [])
+    if inherit_properties:
+        class_properties = class_properties + get_inherited_properties(
+            class_uri, class_properties
+        )
+    add_properties(class_properties, requirements)
+
+    return requirements
+
+
+def add_class_specification(
+    dictionary_name,
+    dictionary_class,
+    ids_documents,
+    use_cache,
+    inherit_properties=False,
+):
+    load_ids()
+
+    languages = list(ids_documents.keys())
+    class_uri = dictionary_class["uri"]
+    class_details = fetch_class_details(BASE_URL, class_uri, use_cache, languages[0])
 
     if not class_details:
         return
 
-    specification = ids.Specification(
-        name=class_details["name"],
-        ifcVersion=IFC_VERSIONS,
-        description=f"Verifies that each object classified as '{class_details['name']}' meets the requirements from the bSDD class: {dictionary_class['uri']}",
+    # Entity, classification and property facets don't depend on the language,
+    # so they are built once and shared by the specification of every language.
+    requirements = get_class_requirements(
+        class_uri, class_details, use_cache, inherit_properties
     )
 
-    # TODO check why uri is not accepted by IfcTester
-    classification = ids.Classification(
-        value=class_details["code"], system=dictionary_name, uri=dictionary_class["uri"]
-    )
-    specification.applicability.append(classification)
+    for index, language_code in enumerate(languages):
+        localized_details = class_details
+        if index > 0:
+            localized_details = fetch_class_details(
+                BASE_URL, class_uri, use_cache, language_code, False
+            )
+            if not localized_details:
+                localized_details = class_details
 
-    requirements = specification.requirements
+        specification = ids.Specification(
+            name=localized_details["name"],
+            ifcVersion=IFC_VERSIONS,
+            description=f"Verifies that each object classified as '{localized_details['name']}' meets the requirements from the bSDD class: {class_uri}",
+        )
 
-    add_entity_facet(class_details.get("relatedIfcEntityNames", []), requirements)
+        # TODO check why uri is not accepted by IfcTester
+        classification = ids.Classification(
+            value=class_details["code"], system=dictionary_name, uri=class_uri
+        )
+        specification.applicability.append(classification)
+        specification.requirements.extend(requirements)
 
-    add_classification_references(
-        class_details.get("classRelations", []), requirements, use_cache
+        ids_documents[language_code].specifications.append(specification)
+
+
+def get_requirements_signature(requirements):
+    return json.dumps(
+        [(type(facet).__name__, facet.asdict("requirement")) for facet in requirements],
+        sort_keys=True,
+        default=str,
     )
 
-    add_properties(class_details.get("classProperties", []), requirements)
 
-    ids_document.specifications.append(specification)
+def get_class_code(specification, dictionary_name):
+    if len(specification.applicability) != 1:
+        return None
+    classification = specification.applicability[0]
+    if not isinstance(classification, ids.Classification):
+        return None
+    if classification.system != dictionary_name or not isinstance(
+        classification.value, str
+    ):
+        return None
+    return classification.value
+
+
+def consolidate_specifications(ids_document, dictionary_name):
+    """Merges class specifications that have identical requirements.
+
+    Each group of classes with the same requirements becomes one specification,
+    applicable to a classification enumeration of the class codes. Other
+    specifications are kept as they are, in their original order.
+
+    Args:
+        ids_document (ids.Ids): The IDS document to consolidate in place.
+        dictionary_name (str): The classification system of the class specifications.
+    """
+    load_ids()
+
+    groups = {}
+    specifications = []
+    for specification in ids_document.specifications:
+        class_code = get_class_code(specification, dictionary_name)
+        if class_code is None:
+            specifications.append(specification)
+            continue
+        signature = get_requirements_signature(specification.requirements)
+        if signature not in groups:
+            groups[signature] = []
+            specifications.append(groups[signature])
+        groups[signature].append((class_code, specification))
+
+    ids_document.specifications = []
+    for item in specifications:
+        if not isinstance(item, list):
+            ids_document.specifications.append(item)
+            continue
+        if len(item) == 1:
+            ids_document.specifications.append(item[0][1])
+            continue
+
+        class_codes = sorted(class_code for class_code, _ in item)
+        first_specification = item[0][1]
+        other_count = len(item) - 1
+        specification = ids.Specification(
+            name=f"{first_specification.name} and {other_count} other {'class' if other_count == 1 else 'classes'}",
+            ifcVersion=IFC_VERSIONS,
+            description=f"Verifies that each object classified as one of {len(class_codes)} classes from the '{dictionary_name}' bSDD dictionary meets the requirements shared by these classes",
+        )
+        specification.applicability.append(
+            ids.Classification(
+                value=ids.Restriction(options={"enumeration": class_codes}),
+                system=dictionary_name,
+            )
+        )
+        specification.requirements.extend(first_specification.requirements)
+        ids_document.specifications.append(specification)
+
+
+def format_size(size):
+    for unit in ["B", "kB", "MB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
 
 
 def get_date(date_time_string):
@@ -522,46 +1169,151 @@ def convert_to_version_097(ids_string):
     return ids_string
 
 
+def get_xml_bytes(xml_string):
+    return f"<?xml version='1.0' encoding='utf-8'?>\n{xml_string}\n".encode("utf-8")
+
+
 def to_xml(xml_string, filepath):
     with open(filepath, "wb") as f:
-        f.write(
-            f"<?xml version='1.0' encoding='utf-8'?>\n{xml_string}\n".encode("utf-8")
-        )
+        f.write(get_xml_bytes(xml_string))
+
+
+def get_language_filepath(filepath, language_code):
+    if not language_code:
+        return filepath
+    root, ext = os.path.splitext(filepath)
+    return f"{root}.{language_code}{ext}"
+
+
+def get_ids_string(ids_document, ids_version):
+    ids_string = ids_document.to_string()
+    if ids_version == "0.9.7":
+        ids_string = convert_to_version_097(ids_string)
+    return ids_string
+
+
+def write_ids(ids_document, xml_file, ids_version):
+    if ids_version == "0.9.7":
+        to_xml(get_ids_string(ids_document, ids_version), xml_file)
+
+    else:
+        ids_document.to_xml(xml_file)
 
 
-def main(xml_file, dictionary_uri, ids_version, ifc_entities, use_cache):
+def build_ids_documents(
+    dictionary_uri,
+    ifc_entities,
+    use_cache,
+    languages=None,
+    inherit_properties=False,
+    follow_ancestors=False,
+):
+    load_ids()
+    from tqdm import tqdm
 
     if use_cache:
         os.makedirs(CACHE_DIR, exist_ok=True)
-        
+
+    if not languages:
+        languages = [None]
+
     dictionary_with_classes = fetch_classes(BASE_URL, dictionary_uri, use_cache)
 
-    ids_document = ids.Ids(
-        title=dictionary_with_classes["name"],
-        copyright=dictionary_with_classes["organizationNameOwner"],
-        version=dictionary_with_classes["version"],
-        description=f'IDS for bSDD dictionary {dictionary_with_classes["name"]}',
-        date=get_date(dictionary_with_classes["lastUpdatedUtc"]),
-    )
+    ids_documents = {}
+    for language_code in languages:
+        ids_document = ids.Ids(
+            title=dictionary_with_classes["name"],
+            copyright=dictionary_with_classes["organizationNameOwner"],
+            version=dictionary_with_classes["version"],
+            description=f'IDS for bSDD dictionary {dictionary_with_classes["name"]}',
+            date=get_date(dictionary_with_classes["lastUpdatedUtc"]),
+        )
 
-    add_global_dictionary_applicability(
-        dictionary_with_classes["name"], dictionary_uri, ids_document, ifc_entities
+        add_global_dictionary_applicability(
+            dictionary_with_classes["name"], dictionary_uri, ids_document, ifc_entities
+        )
+        ids_documents[language_code] = ids_document
+
+    class_uris = [
+        classification["uri"] for classification in dictionary_with_classes["classes"]
+    ]
+    prefetch_class_details(class_uris, languages, use_cache)
+    build_relation_graph(
+        class_uris, use_cache, languages[0], inherit_properties or follow_ancestors
     )
 
+    # Building the datatype index pages through the whole IFC property list, so
+    # only do it when a class (or an inherited ancestor) uses an IFC property.
+    if uses_ifc_properties(class_uris, inherit_properties):
+        load_property_datatype_index(BASE_URL, use_cache)
+
     for classification in tqdm(dictionary_with_classes["classes"]):
         add_class_specification(
             dictionary_with_classes["name"],
             classification,
-            ids_document,
+            ids_documents,
             use_cache,
+            inherit_properties,
         )
 
-    if ids_version == "0.9.7":
-        ids_string = ids_document.to_string()
-        to_xml(convert_to_version_097(ids_string), xml_file)
+    return ids_documents
 
+
+def main(
+    xml_file,
+    dictionary_uri,
+    ids_version,
+    ifc_entities,
+    use_cache,
+    languages,
+    consolidate,
+    inherit_properties,
+    graph_file,
+):
+    ids_documents = build_ids_documents(
+        dictionary_uri,
+        ifc_entities,
+        use_cache,
+        languages,
+        inherit_properties,
+        bool(graph_file),
+    )
+
+    if graph_file:
+        export_relation_graph(graph_file)
+
+    for language_code, ids_document in ids_documents.items():
+        filepath = get_language_filepath(xml_file, language_code)
+
+        if not consolidate:
+            write_ids(ids_document, filepath, ids_version)
+            continue
+
+        # Both sizes are measured on the serialized file content. The consolidated
+        # string is written as is, so only the measurement before consolidation
+        # is an extra serialization.
+        spec_count = len(ids_document.specifications)
+        size = len(get_xml_bytes(get_ids_string(ids_document, ids_version)))
+        consolidate_specifications(ids_document, ids_document.info["title"])
+
+        consolidated_spec_count = len(ids_document.specifications)
+        consolidated_xml = get_xml_bytes(get_ids_string(ids_document, ids_version))
+        consolidated_size = len(consolidated_xml)
+        with open(filepath, "wb") as f:
+            f.write(consolidated_xml)
+        print(
+            f"{filepath}: {spec_count} -> {consolidated_spec_count} specifications, "
+            f"{format_size(size)} -> {format_size(consolidated_size)}"
+        )
+
+
+def get_languages(languages):
+    if languages:
+        return [
+            language.strip() for language in languages.split(",") if language.strip()
+        ]
     else:
-        ids_document.to_xml(xml_file)
+        return None
 
 
 if __name__ == "__main__":
@@ -584,6 +1336,28 @@ if __name__ == "__main__":
     parser.add_argument(
         "-c", "--use_cache", action="store_true", default=False, help="Use local cache"
     )
+    parser.add_argument(
+        "-l",
+        "--languages",
+        help="Comma separated language codes, writes one IDS file per language (e.g. nl-NL,en-GB)",
+    )
+    parser.add_argument(
+        "-s",
+        "--consolidate",
+        action="store_true",
+        default=False,
+        help="Merge classes with identical requirements into one specification",
+    )
+    parser.add_argument(
+        "-p",
+        "--inherit_properties",
+        action="store_true",
+        default=False,
+        help="Add the properties of parent classes (IsChildOf) to each class",
+    )
+    parser.add_argument(
+        "-g", "--graph_file", help="Export the class relation graph to a JSON file"
+    )
 
     args = parser.parse_args()
 
@@ -593,4 +1367,8 @@ if __name__ == "__main__":
         args.version,
         args.ifc_entities,
         args.use_cache,
+        get_languages(args.languages),
+        args.consolidate,
+        args.inherit_properties,
+        args.graph_file,
     )
@@ -2,7 +2,6 @@ import argparse
 import json
 import re
 from datetime import datetime
-from ifctester import open as open_ids
 
 # Mapping dictionary for data types
 DATA_TYPE_MAPPING = {
@@ -167,6 +166,8 @@ def remove_none_and_empty_values(d):
         return d
     
 def main(input_file, output_file, organization_code, change_request_email):
+    from ifctester import open as open_ids
+
     xml_file = input_file
     ids_document = open_ids(xml_file, validate=False)
     ids_data = ids_document.asdict()
@@ -0,0 +1,193 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from bsdd_to_ids import (
+    build_ids_documents,
+    consolidate_specifications,
+)
+
+REPORT_FORMATS = {
+    "json": ("Json", ".json"),
+    "html": ("Html", ".html"),
+    "bcf": ("Bcf", ".bcf"),
+}
+
+worker_ids_document = None
+
+
+def init_worker(ids_document):
+    global worker_ids_document
+    worker_ids_document = ids_document
+
+
+def get_report_filepaths(report_dir, ifc_file_paths, report_format):
+    """Maps each IFC model to a unique report filepath.
+
+    Reports mirror the directories of the models relative to their common
+    directory, so models with the same filename don't overwrite each other.
+
+    Args:
+        report_dir (str): The directory for the report files.
+        ifc_file_paths (list): The filepaths of the IFC models.
+        report_format (str): One of the REPORT_FORMATS keys.
+
+    Returns:
+        dict: Mapping of IFC filepath to report filepath.
+    """
+    abs_paths = [os.path.abspath(ifc_file_path) for ifc_file_path in ifc_file_paths]
+    common_dir = os.path.commonpath([os.path.dirname(path) for path in abs_paths])
+    report_filepaths = {}
+    for ifc_file_path, abs_path in zip(ifc_file_paths, abs_paths):
+        name = os.path.splitext(os.path.relpath(abs_path, common_dir))[0]
+        report_filepaths[ifc_file_path] = os.path.join(
+            report_dir, f"{name}{REPORT_FORMATS[report_format][1]}"
+        )
+    return report_filepaths
+
+
+def validate_ifc_file(ifc_file_path, report_format, report_filepath):
+    """Validates one IFC model against the IDS document of this worker process.
+
+    Args:
+        ifc_file_path (str): The filepath of the IFC model.
+        report_format (str): One of the REPORT_FORMATS keys.
+        report_filepath (str): The filepath of the report.
+
+    Returns:
+        tuple: The IFC filepath, whether all specifications passed and the report filepath.
+    """
+    import ifcopenshell
+    from ifctester import reporter
+
+    ifc_file = ifcopenshell.open(ifc_file_path)
+    worker_ids_document.validate(ifc_file, filepath=ifc_file_path)
+
+    report_class = getattr(reporter, REPORT_FORMATS[report_format][0])
+    report = report_class(worker_ids_document)
+    report.report()
+    os.makedirs(os.path.dirname(report_filepath) or ".", exist_ok=True)
+    report.to_file(report_filepath)
+
+    passed = all(
+        specification.status is not False
+        for specification in worker_ids_document.specifications
+    )
+    return ifc_file_path, passed, report_filepath
+
+
+def main(
+    dictionary_uri,
+    ifc_file_paths,
+    report_format,
+    report_dir,
+    ifc_entities,
+    use_cache,
+    language,
+    consolidate,
+    workers,
+):
+    languages = [language] if language else None
+    ids_documents = build_ids_documents(
+        dictionary_uri, ifc_entities, use_cache, languages
+    )
+    ids_document = next(iter(ids_documents.values()))
+
+    if consolidate:
+        consolidate_specifications(ids_document, ids_document.info["title"])
+
+    # Listing the same model twice would only overwrite its report
+    ifc_file_paths = list(dict.fromkeys(ifc_file_paths))
+    report_filepaths = get_report_filepaths(report_dir, ifc_file_paths, report_format)
+
+    failed_count = 0
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(ids_document,)
+    ) as executor:
+        futures = {
+            executor.submit(
+                validate_ifc_file,
+                ifc_file_path,
+                report_format,
+                report_filepaths[ifc_file_path],
+            ): ifc_file_path
+            for ifc_file_path in ifc_file_paths
+        }
+        for future in as_completed(futures):
+            try:
+                ifc_file_path, passed, report_filepath = future.result()
+            except Exception as e:
+                failed_count += 1
+                print(f"ERROR {futures[future]}: {e}")
+                continue
+            if not passed:
+                failed_count += 1
+            print(
+                f"{'PASSED' if passed else 'FAILED'} {ifc_file_path}: {report_filepath}"
+            )
+
+    return failed_count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Validate IFC models against a bSDD dictionary, without writing an intermediate IDS file",
+        epilog="Example command: python validate_ifc.py https://identifier.buildingsmart.org/uri/volkerwesselsbvgo/basis_bouwproducten_oene/latest model1.ifc model2.ifc -f html",
+    )
+    parser.add_argument("dictionary_uri", type=str, help="The URI for the dictionary")
+    parser.add_argument(
+        "ifc_file_paths", type=str, nargs="+", help="The filepaths of the IFC models"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        default="json",
+        choices=list(REPORT_FORMATS.keys()),
+        help="The report format (default: json)",
+    )
+    parser.add_argument(
+        "-o",
+        "--report_dir",
+        type=str,
+        default="reports",
+        help="The directory for the reports (default: reports)",
+    )
+    parser.add_argument("-i", "--ifc_entities", help="Applicable IFC entities")
+    parser.add_argument(
+        "-c",
+        "--use_cache",
+        action="store_true",
+        default=False,
+        help="Use local cache, e.g. a cached snapshot of the dictionary",
+    )
+    parser.add_argument("-l", "--language", help="Language code (e.g. nl-NL)")
+    parser.add_argument(
+        "-s",
+        "--consolidate",
+        action="store_true",
+        default=False,
+        help="Merge classes with identical requirements into one specification",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of validation processes (default: number of CPUs)",
+    )
+
+    args = parser.parse_args()
+
+    failed_count = main(
+        args.dictionary_uri,
+        args.ifc_file_paths,
+        args.format,
+        args.report_dir,
+        args.ifc_entities,
+        args.use_cache,
+        args.language,
+        args.consolidate,
+        args.workers,
+    )
+    raise SystemExit(1 if failed_count else 0)